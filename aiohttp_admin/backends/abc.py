@@ -5,15 +5,15 @@ from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from datetime import date, datetime, time
 from enum import Enum
-from functools import cached_property, partial
+from functools import cached_property
 from types import MappingProxyType
 from typing import Any, Generic, Literal, Optional, TypeVar, final
 
 from aiohttp import web
 from aiohttp_security import check_permission, permits
-from pydantic import Json
+from pydantic import Json, TypeAdapter
 
-from ..security import check, permissions_as_dict
+from ..security import check, get_type_adapter, permissions_as_mapping
 from ..types import ComponentState, InputState, fk, resources_key
 
 if sys.version_info >= (3, 10):
@@ -51,7 +51,11 @@ class Encoder(json.JSONEncoder):
         return super().default(o)
 
 
-json_response = partial(web.json_response, dumps=partial(json.dumps, cls=Encoder))
+_encoder = Encoder()
+
+
+def json_response(data: object, **kwargs: Any) -> web.Response:
+    return web.json_response(data, dumps=_encoder.encode, **kwargs)
 
 
 class APIRecord(TypedDict):
@@ -155,6 +159,9 @@ class AbstractAdminResource(ABC, Generic[_ID]):
             record_type = {k.removeprefix("data."): Any for k in self.inputs}
         self._raw_record_type = record_type
         self._record_type = TypedDict("RecordType", record_type, total=False)  # type: ignore[misc]
+        self._input_names = frozenset(self.inputs)
+        # Field validators are built on first use, see _check_field().
+        self._field_validators: dict[str, TypeAdapter[Any]] = {}
 
     @final
     async def filter_by_permissions(self, request: web.Request, perm_type: str,
@@ -235,7 +242,7 @@ class AbstractAdminResource(ABC, Generic[_ID]):
     async def _get_one(self, request: web.Request) -> web.Response:
         await check_permission(request, f"admin.{self.name}.view", context=(request, None))
         query = check(GetOneParams, request.query)
-        record_id = check(self._id_type, query["id"].split("|"))
+        record_id = self._id_validator.validate_python(query["id"].split("|"))
 
         result = await self.get_one(record_id, query.get("meta"))
         if not await permits(request, f"admin.{self.name}.view", context=(request, result)):
@@ -246,7 +253,7 @@ class AbstractAdminResource(ABC, Generic[_ID]):
     async def _get_many(self, request: web.Request) -> web.Response:
         await check_permission(request, f"admin.{self.name}.view", context=(request, None))
         query = check(GetManyParams, request.query)
-        record_ids = check(tuple[self._id_type, ...], (q.split("|") for q in query["ids"]))  # type: ignore[name-defined]
+        record_ids = self._ids_validator.validate_python(q.split("|") for q in query["ids"])
 
         raw_results = await self.get_many(record_ids, query.get("meta"))
         if not raw_results:
@@ -271,11 +278,11 @@ class AbstractAdminResource(ABC, Generic[_ID]):
 
         if query["target"].startswith("fk_"):
             target = tuple(query["target"].removeprefix("fk_").split("__"))
-            record_id = tuple(check(self._raw_record_type[k], v)
+            record_id = tuple(self._check_field(k, v)
                               for k, v in zip(target, query["id"].split("|")))
         else:
             target = (query["target"],)
-            record_id = check(self._id_type, query["id"].split("|"))
+            record_id = self._id_validator.validate_python(query["id"].split("|"))
 
         raw_results, total = await self.get_many_ref({**query, "target": target, "id": record_id})
 
@@ -287,9 +294,7 @@ class AbstractAdminResource(ABC, Generic[_ID]):
     async def _create(self, request: web.Request) -> web.Response:
         query = check(CreateParams, request.query)
         # TODO(Pydantic): Dissallow extra arguments
-        for k in query["data"]["data"]:
-            if k not in self.inputs:
-                raise web.HTTPBadRequest(reason=f"Invalid field '{k}'")
+        self._check_fields(query["data"]["data"])
         record = self._check_record(query["data"]["data"])
         await check_permission(request, f"admin.{self.name}.add", context=(request, record))
         for k, v in record.items():
@@ -304,11 +309,9 @@ class AbstractAdminResource(ABC, Generic[_ID]):
     async def _update(self, request: web.Request) -> web.Response:
         await check_permission(request, f"admin.{self.name}.edit", context=(request, None))
         query = check(UpdateParams, request.query)
-        record_id = check(self._id_type, query["id"].split("|"))
+        record_id = self._id_validator.validate_python(query["id"].split("|"))
         # TODO(Pydantic): Dissallow extra arguments
-        for k in query["data"]["data"]:
-            if k not in self.inputs:
-                raise web.HTTPBadRequest(reason=f"Invalid field '{k}'")
+        self._check_fields(query["data"]["data"])
         record = self._check_record(query["data"]["data"])
         previous_data = self._check_record(query["previousData"]["data"])
 
@@ -335,11 +338,9 @@ class AbstractAdminResource(ABC, Generic[_ID]):
     async def _update_many(self, request: web.Request) -> web.Response:
         await check_permission(request, f"admin.{self.name}.edit", context=(request, None))
         query = check(UpdateManyParams, request.query)
-        record_ids = check(tuple[self._id_type, ...], (i.split("|") for i in query["ids"]))  # type: ignore[name-defined]
+        record_ids = self._ids_validator.validate_python(i.split("|") for i in query["ids"])
         # TODO(Pydantic): Dissallow extra arguments
-        for k in query["data"]:
-            if k not in self.inputs:
-                raise web.HTTPBadRequest(reason=f"Invalid field '{k}'")
+        self._check_fields(query["data"])
         record = self._check_record(query["data"])
 
         # Check original records are allowed by permission filters.
@@ -364,7 +365,7 @@ class AbstractAdminResource(ABC, Generic[_ID]):
     async def _delete(self, request: web.Request) -> web.Response:
         await check_permission(request, f"admin.{self.name}.delete", context=(request, None))
         query = check(DeleteParams, request.query)
-        record_id = check(self._id_type, query["id"].split("|"))
+        record_id = self._id_validator.validate_python(query["id"].split("|"))
         previous_data = self._check_record(query["previousData"]["data"])
 
         original = await self.get_one(record_id, query.get("meta"))
@@ -378,7 +379,7 @@ class AbstractAdminResource(ABC, Generic[_ID]):
     async def _delete_many(self, request: web.Request) -> web.Response:
         await check_permission(request, f"admin.{self.name}.delete", context=(request, None))
         query = check(DeleteManyParams, request.query)
-        record_ids = check(tuple[self._id_type, ...], (i.split("|") for i in query["ids"]))  # type: ignore[name-defined]
+        record_ids = self._ids_validator.validate_python(i.split("|") for i in query["ids"])
 
         originals = await self.get_many(record_ids, query.get("meta"))
         allowed = await asyncio.gather(*(permits(request, f"admin.{self.name}.delete",
@@ -391,10 +392,44 @@ class AbstractAdminResource(ABC, Generic[_ID]):
             raise web.HTTPNotFound()
         return json_response({"data": self._convert_ids(ids)})
 
+    @final
+    def _check_fields(self, record: Record) -> None:
+        """Check record only contains fields that have an input."""
+        invalid = record.keys() - self._input_names
+        if invalid:
+            fields = "', '".join(sorted(invalid))
+            plural = "s" if len(invalid) > 1 else ""
+            raise web.HTTPBadRequest(reason=f"Invalid field{plural} '{fields}'")
+
+    @final
+    def _check_field(self, name: str, value: object) -> object:
+        """Check and convert a single field value."""
+        validator = self._field_validators.get(name)
+        if validator is None:
+            if name not in self._raw_record_type:
+                raise web.HTTPBadRequest(reason=f"Invalid field '{name}'")
+            # Field types repeat across resources (int, Optional[str]...), so share them.
+            validator = get_type_adapter(self._raw_record_type[name])
+            self._field_validators[name] = validator
+        return validator.validate_python(value)
+
     @final
     def _check_record(self, record: Record) -> Record:
         """Check and convert input record."""
-        return check(self._record_type, record)
+        return self._record_validator.validate_python(record)
+
+    @cached_property
+    def _record_validator(self) -> TypeAdapter[Record]:
+        # Built on first use, so types which can't be validated only fail when used.
+        return TypeAdapter(self._record_type)
+
+    @cached_property
+    def _id_validator(self) -> TypeAdapter[_ID]:
+        return TypeAdapter(self._id_type)
+
+    @cached_property
+    def _ids_validator(self) -> TypeAdapter[tuple[_ID, ...]]:
+        return TypeAdapter(tuple.__class_getitem__((self._id_type, ...)))
 
     @final
     async def _convert_record(self, record: Record, request: web.Request) -> APIRecord:
@@ -429,18 +464,19 @@ class AbstractAdminResource(ABC, Generic[_ID]):
             if k.startswith("fk_"):
                 v = check(str, v)
                 for c, cv in zip(k.removeprefix("fk_").split("__"), v.split("|")):
-                    merged_filter[c] = check(self._raw_record_type[c], cv)
+                    merged_filter[c] = self._check_field(c, cv)
             else:
-                merged_filter[k] = check(self._raw_record_type[k], v)
+                merged_filter[k] = self._check_field(k, v)
         query["filter"] = merged_filter
 
         # Add filters from advanced permissions.
         # The permissions will be cached on the request from a previous permissions check.
-        permissions = permissions_as_dict(request["aiohttpadmin_permissions"])
+        permissions = permissions_as_mapping(request["aiohttpadmin_permissions"])
         filters = permissions.get(f"admin.{self.name}.view",
                                   permissions.get(f"admin.{self.name}.*", {}))
         for k, v in filters.items():
-            query["filter"][k] = v
+            # Copy, as the backend receives (and may modify) the filter.
+            query["filter"][k] = list(v)
 
     @cached_property
     def routes(self) -> tuple[web.RouteDef, ...]:
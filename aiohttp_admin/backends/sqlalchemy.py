@@ -4,6 +4,7 @@ import logging
 import operator
 import sys
 from collections.abc import Callable, Coroutine, Iterator, Sequence
+from functools import lru_cache
 from types import MappingProxyType as MPT
 from typing import Any, Literal, Optional, TypeVar, Union, cast
 
@@ -77,12 +78,21 @@ FIELD_TYPES: MPT[type[sa.types.TypeEngine[Any]], _FieldTypesValues] = MPT({
 _Components = tuple[str, str, dict[str, object], dict[str, object]]
 
 
-def get_components(t: sa.types.TypeEngine[object]) -> _Components:
-    for key, (field, inp, field_props, input_props) in FIELD_TYPES.items():
-        if isinstance(t, key):
-            return (field, inp, field_props.copy(), input_props.copy())
+@lru_cache(maxsize=256)
+def _components_for(t: type[sa.types.TypeEngine[object]]) -> _FieldTypesValues:
+    """Return the (shared) FIELD_TYPES entry for an SA type class."""
+    # Walk the MRO so the most specific registered type wins without isinstance().
+    for base in t.__mro__:
+        values = FIELD_TYPES.get(base)
+        if values is not None:
+            return values
+
+    return ("TextField", "TextInput", MPT({}), MPT({}))
 
-    return ("TextField", "TextInput", {}, {})
+
+def get_components(t: sa.types.TypeEngine[object]) -> _Components:
+    field, inp, field_props, input_props = _components_for(type(t))  # type: ignore[arg-type]
+    return (field, inp, field_props.copy(), input_props.copy())
 
 
 def handle_errors(
@@ -176,6 +186,8 @@ class SAResource(AbstractAdminResource[tuple[Any, ...]]):
 
         self._db = db
         self._table = table
+        # Select statements are immutable, so the base query can be shared.
+        self._select = sa.select(table)
         self.name = table.name
         self.primary_key = tuple(filter(lambda c: table.c[c].primary_key, self._table.c.keys()))
         if not self.primary_key:
@@ -302,7 +314,7 @@ class SAResource(AbstractAdminResource[tuple[Any, ...]]):
         offset = (params["pagination"]["page"] - 1) * per_page
 
         filters = params["filter"]
-        query = sa.select(self._table)
+        query = self._select
         if filters:
             query = query.where(*create_filters(self._table.c, filters))
 
@@ -325,14 +337,14 @@ class SAResource(AbstractAdminResource[tuple[Any, ...]]):
     @handle_errors
     async def get_one(self, record_id: tuple[Any, ...], meta: Meta) -> Record:
         async with self._db.connect() as conn:
-            stmt = sa.select(self._table).where(*self._cmp_pk(record_id))
+            stmt = self._select.where(*self._cmp_pk(record_id))
             result = await conn.execute(stmt)
             return result.one()._asdict()
 
     @handle_errors
     async def get_many(self, record_ids: Sequence[tuple[Any, ...]], meta: Meta) -> list[Record]:
         async with self._db.connect() as conn:
-            stmt = sa.select(self._table).where(self._cmp_pk_many(record_ids))
+            stmt = self._select.where(self._cmp_pk_many(record_ids))
             result = await conn.execute(stmt)
             return [r._asdict() for r in result]
 
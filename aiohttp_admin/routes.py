@@ -18,14 +18,16 @@ def setup_resources(admin: web.Application, schema: Schema) -> None:
         admin.router.add_routes(m.routes)
 
         try:
-            omit_fields = m.fields.keys() - r["display"]
+            display = frozenset(r["display"])
         except KeyError:
             omit_fields = m.omit_fields
         else:
-            if not all(f in m.fields for f in r["display"]):
+            if not display.issubset(m.fields):
                 raise ValueError(f"Display includes non-existent field {r['display']}")
+            omit_fields = m.fields.keys() - display
         # TODO: Use label: https://github.com/marmelab/react-admin/issues/9587
         omit_fields = tuple(m.fields[f]["props"].get("source") for f in omit_fields)
+        omit_lookup = frozenset(omit_fields)
 
         repr_field = r.get("repr", data(m.primary_key[0]))
         if repr_field.removeprefix("data.") not in m.fields:
@@ -39,7 +41,7 @@ def setup_resources(admin: web.Application, schema: Schema) -> None:
         input_props = r.get("input_props", {})
         for k, v in inputs.items():
             k = k.removeprefix("data.")
-            if k not in omit_fields:
+            if k not in omit_lookup:
                 v["props"]["alwaysOn"] = "alwaysOn"  # Always display filter
             if k in validators:
                 v["props"]["validate"] = (tuple(v["props"].get("validate", ()))
@@ -50,7 +52,7 @@ def setup_resources(admin: web.Application, schema: Schema) -> None:
             fields[name]["props"].update(props)
 
         state: _ResourceState = {
-            "fields": fields, "inputs": inputs, "list_omit": tuple(omit_fields),
+            "fields": fields, "inputs": inputs, "list_omit": omit_fields,
             "repr": repr_field, "label": r.get("label"), "icon": r.get("icon"),
             "bulk_update": r.get("bulk_update", {}), "urls": {},
             "show_actions": r.get("show_actions", ())}
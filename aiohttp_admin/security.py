@@ -2,6 +2,7 @@ import json
 from collections.abc import Collection, Mapping, Sequence
 from enum import Enum
 from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Type, TypeVar, Union
 
 from aiohttp import web
@@ -15,14 +16,15 @@ _T = TypeVar("_T")
 
 
 @lru_cache  # https://github.com/python/typeshed/issues/6347
-def _get_schema(t: Type[_T]) -> TypeAdapter[_T]:  # type: ignore[misc]
+def get_type_adapter(t: Type[_T]) -> TypeAdapter[_T]:  # type: ignore[misc]
+    """Return a (cached) TypeAdapter for static type t."""
     return TypeAdapter(t)
 
 
 def check(t: Type[_T], value: object) -> _T:
     """Validate value is of static type t."""
     # https://github.com/python/mypy/issues/11470
-    return _get_schema(t).validate_python(value)  # type: ignore[arg-type,no-any-return]
+    return get_type_adapter(t).validate_python(value)  # type: ignore[arg-type,no-any-return]
 
 
 class Permissions(str, Enum):
@@ -72,6 +74,24 @@ def permissions_as_dict(permissions: Collection[str]) -> dict[str, dict[str, lis
     return p_dict
 
 
+_PermissionsMapping = Mapping[str, Mapping[str, Sequence[object]]]
+
+
+@lru_cache(maxsize=512)
+def _permissions_as_mapping(permissions: tuple[str, ...]) -> _PermissionsMapping:
+    return MappingProxyType({
+        perm: MappingProxyType({k: tuple(v) for k, v in filters.items()})
+        for perm, filters in permissions_as_dict(permissions).items()})
+
+
+def permissions_as_mapping(permissions: Collection[str]) -> _PermissionsMapping:
+    """Cached permissions_as_dict() for the checks repeated on every request.
+
+    The result is shared between calls, so it is returned as read-only mappings of tuples.
+    """
+    return _permissions_as_mapping(tuple(permissions))
+
+
 class AdminAuthorizationPolicy(AbstractAuthorizationPolicy):
     def __init__(self, schema: Schema):
         super().__init__()
@@ -103,7 +123,7 @@ class AdminAuthorizationPolicy(AbstractAuthorizationPolicy):
                 permissions = user["permissions"]
             # Cache permissions per request to avoid potentially dozens of DB calls.
             request["aiohttpadmin_permissions"] = permissions
-        return has_permission(permission, permissions_as_dict(permissions), record)
+        return has_permission(permission, permissions_as_mapping(permissions), record)
 
 
 class TokenIdentityPolicy(SessionIdentityPolicy):
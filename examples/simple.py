@@ -8,7 +8,7 @@ from enum import Enum
 
 import sqlalchemy as sa
 from aiohttp import web
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 import aiohttp_admin
@@ -51,17 +51,15 @@ async def check_credentials(username: str, password: str) -> bool:
 
 async def create_app() -> web.Application:
     engine = create_async_engine("sqlite+aiosqlite:///:memory:")
-    session = async_sessionmaker(engine, expire_on_commit=False)
 
     # Create some sample data
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    async with session.begin() as sess:
-        sess.add(Simple(num=5, value="first"))
-        p = Simple(num=82, optional_num=12, value="with child")
-        sess.add(p)
-    async with session.begin() as sess:
-        sess.add(SimpleParent(id=p.id, date=datetime(2023, 2, 13, 19, 4)))
+        await conn.execute(sa.insert(Simple), {"num": 5, "value": "first"})
+        p_id = await conn.scalar(sa.insert(Simple).returning(Simple.id), {
+            "num": 82, "optional_num": 12, "value": "with child"})
+        await conn.execute(sa.insert(SimpleParent),
+                           {"id": p_id, "date": datetime(2023, 2, 13, 19, 4)})
 
     app = web.Application()
 
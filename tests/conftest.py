@@ -1,3 +1,4 @@
+import copy
 from collections.abc import Awaitable, Callable
 from typing import Optional
 from unittest.mock import AsyncMock, create_autospec
@@ -48,15 +49,47 @@ model2 = web.AppKey[type[Dummy2Model]]("model2")
 db = web.AppKey("db", async_sessionmaker[AsyncSession])
 admin = web.AppKey("admin", web.Application)
 
+# Resources inspected in previous tests, see sa_resource().
+_resource_cache: dict[type[Base], SAResource] = {}
+
+
+def sa_resource(engine: AsyncEngine, m: type[Base]) -> SAResource:
+    """Return a resource for the model, reusing the model inspection across tests."""
+    r = _resource_cache.get(m)
+    if r is None:
+        r = _resource_cache[m] = SAResource(engine, m)
+    # Copy before routes (bound to the instance) get cached by aiohttp_admin.setup().
+    r = copy.copy(r)
+    r._db = engine
+    return r
+
 
 @pytest.fixture
 def mock_engine() -> AsyncMock:
     return create_autospec(AsyncEngine, instance=True, spec_set=True)  # type: ignore[no-any-return] # noqa: B950
 
 
+@pytest.fixture(scope="session")
+def db_dump() -> str:
+    """SQL script to recreate the test database, built once per test session."""
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        dummy_id = conn.scalar(sa.insert(DummyModel).returning(DummyModel.id))
+        conn.execute(sa.insert(Dummy2Model),
+                     ({"msg": "Test"}, {"msg": "Test"}, {"msg": "Other"}))
+        conn.execute(sa.insert(ForeignModel), {"dummy": dummy_id})
+    raw = engine.raw_connection()
+    try:
+        return "\n".join(raw.driver_connection.iterdump())  # type: ignore[union-attr]
+    finally:
+        raw.close()
+        engine.dispose()
+
+
 @pytest.fixture
 def create_admin_client(
-    aiohttp_client: Callable[[web.Application], Awaitable[TestClient]]
+    aiohttp_client: Callable[[web.Application], Awaitable[TestClient]], db_dump: str
 ) -> Callable[[Optional[IdentityCallback]], Awaitable[TestClient]]:
     async def admin_client(identity_callback: Optional[IdentityCallback] = None) -> TestClient:
         app = web.Application()
@@ -64,16 +97,10 @@ def create_admin_client(
         app[model2] = Dummy2Model
         engine = create_async_engine("sqlite+aiosqlite:///:memory:")
         app[db] = async_sessionmaker(engine, expire_on_commit=False)
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        async with app[db].begin() as sess:
-            dummy = DummyModel()
-            sess.add(dummy)
-            sess.add(Dummy2Model(msg="Test"))
-            sess.add(Dummy2Model(msg="Test"))
-            sess.add(Dummy2Model(msg="Other"))
-        async with app[db].begin() as sess:
-            sess.add(ForeignModel(dummy=dummy.id))
+        # The in-memory database uses a single connection, so load the dump through it.
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.executescript(db_dump)  # type: ignore[union-attr]
 
         schema: aiohttp_admin.Schema = {
             "security": {
@@ -81,9 +108,9 @@ def create_admin_client(
                 "secure": False
             },
             "resources": (
-                {"model": SAResource(engine, DummyModel)},
-                {"model": SAResource(engine, Dummy2Model)},
-                {"model": SAResource(engine, ForeignModel)}
+                {"model": sa_resource(engine, DummyModel)},
+                {"model": sa_resource(engine, Dummy2Model)},
+                {"model": sa_resource(engine, ForeignModel)}
             )
         }
         if identity_callback:
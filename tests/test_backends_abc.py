@@ -3,6 +3,9 @@ from collections.abc import Awaitable, Callable
 
 from aiohttp.test_utils import TestClient
 
+from _resources import DummyResource
+from aiohttp_admin.backends.abc import AbstractAdminResource, _ListQuery
+from aiohttp_admin.types import comp
 from conftest import admin
 
 _Login = Callable[[TestClient], Awaitable[dict[str, str]]]
@@ -26,3 +29,48 @@ async def test_invalid_field(admin_client: TestClient, login: _Login) -> None:
     async with admin_client.post(url, params=p, headers=h) as resp:
         assert resp.status == 400, await resp.text()
         assert "Invalid field 'incorrect'" in await resp.text()
+
+
+async def test_invalid_fields(admin_client: TestClient, login: _Login) -> None:
+    h = await login(admin_client)
+    assert admin_client.app
+    url = admin_client.app[admin].router["dummy2_create"].url_for()
+    p = {"data": json.dumps({"data": {"incorrect": "foo", "bad": 1}})}
+    async with admin_client.post(url, params=p, headers=h) as resp:
+        assert resp.status == 400, await resp.text()
+        assert "Invalid fields 'bad', 'incorrect'" in await resp.text()
+
+
+def test_permission_filters_not_shared() -> None:
+    r = DummyResource("dummy", {"id": comp("TextField", {"source": "id"})},
+                      {"id": comp("TextInput") | {"show_create": True}},  # type: ignore[dict-item]
+                      "id")
+    request = {"aiohttpadmin_permissions": ("admin.dummy.view|id=1|id=2",)}
+
+    query: _ListQuery = {"sort": {"field": "id", "order": "ASC"}, "filter": {}}
+    r._process_list_query(query, request)  # type: ignore[arg-type]
+    assert query["filter"] == {"id": [1, 2]}
+    # A backend modifying the filter must not affect later requests.
+    query["filter"]["id"].append(99)  # type: ignore[attr-defined]
+
+    query = {"sort": {"field": "id", "order": "ASC"}, "filter": {}}
+    r._process_list_query(query, request)  # type: ignore[arg-type]
+    assert query["filter"] == {"id": [1, 2]}
+
+
+def test_id_type_after_init() -> None:
+    class LateIdResource(DummyResource):
+        def __init__(self) -> None:
+            self.name = "late"
+            self.fields = {}
+            self.inputs = {}
+            self.primary_key = ("id",)
+            self.omit_fields = set()
+            self._foreign_rows = set()
+            AbstractAdminResource.__init__(self)
+            # Backends may set _id_type after calling AbstractAdminResource.__init__().
+            self._id_type = tuple[str]  # type: ignore[assignment]
+
+    r = LateIdResource()
+    assert r._id_validator.validate_python(["5"]) == ("5",)
+    assert r._ids_validator.validate_python((["1"], ["2"])) == (("1",), ("2",))
@@ -575,3 +575,119 @@ async def test_record_type(
         errors = await resp.json()
         assert any(e["loc"] == ["foo"] and e["type"] == "bool_parsing" for e in errors)
         assert any(e["loc"] == ["bar"] and e["type"] == "int_type" for e in errors)
+
+
+def test_subtype_components(base: type[DeclarativeBase], mock_engine: AsyncEngine) -> None:
+    class TestModel(base):  # type: ignore[misc,valid-type]
+        __tablename__ = "test"
+        id: Mapped[int] = mapped_column(sa.BigInteger, primary_key=True)
+        value: Mapped[float] = mapped_column(sa.Float)
+        text: Mapped[str] = mapped_column(sa.Unicode(10))
+
+    r = SAResource(mock_engine, TestModel)
+    assert r.fields["id"]["type"] == "NumberField"
+    assert r.fields["value"]["type"] == "NumberField"
+    assert r.fields["text"]["type"] == "TextField"
+    assert r.inputs["text"]["type"] == "TextInput"
+
+
+async def test_shared_field_validators(
+    base: DeclarativeBase, aiohttp_client: Callable[[web.Application], Awaitable[TestClient]],
+    login: _Login
+) -> None:
+    class TestA(base):  # type: ignore[misc,valid-type]
+        __tablename__ = "test_a"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        msg: Mapped[Optional[str]]
+
+    class TestB(base):  # type: ignore[misc,valid-type]
+        __tablename__ = "test_b"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        msg: Mapped[Optional[str]]
+
+    app = web.Application()
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(base.metadata.create_all)
+        await conn.execute(sa.insert(TestA), ({"msg": "foo"}, {"msg": "bar"}))
+        await conn.execute(sa.insert(TestB), ({"msg": "foo"}, {"msg": "bar"}))
+
+    a = SAResource(engine, TestA)
+    b = SAResource(engine, TestB)
+    schema: aiohttp_admin.Schema = {
+        "security": {
+            "check_credentials": check_credentials,
+            "secure": False
+        },
+        "resources": ({"model": a}, {"model": b})
+    }
+    app[admin] = aiohttp_admin.setup(app, schema)
+
+    admin_client = await aiohttp_client(app)
+    assert admin_client.app
+    h = await login(admin_client)
+
+    for name in ("test_a", "test_b"):
+        url = app[admin].router[f"{name}_get_list"].url_for()
+        p = {"pagination": json.dumps({"page": 1, "perPage": 10}),
+             "sort": json.dumps({"field": "id", "order": "ASC"}),
+             "filter": json.dumps({"msg": "fo", "id": "1"})}
+        async with admin_client.get(url, params=p, headers=h) as resp:
+            assert resp.status == 200
+            assert await resp.json() == {"data": [{"id": "1", "data": {"id": 1, "msg": "foo"}}],
+                                         "total": 1}
+
+        p["filter"] = json.dumps({"msg": ["foo", "bar"]})
+        async with admin_client.get(url, params=p, headers=h) as resp:
+            assert resp.status == 400
+            errors = await resp.json()
+            assert any(e["type"] == "string_type" for e in errors)
+
+
+async def test_unsupported_python_type(
+    base: DeclarativeBase, aiohttp_client: Callable[[web.Application], Awaitable[TestClient]],
+    login: _Login
+) -> None:
+    class Point:
+        """Custom class that pydantic can't generate a schema for."""
+
+    class PointType(TypeDecorator[str]):
+        impl = sa.String
+        cache_ok = True
+
+        @property
+        def python_type(self) -> type[Point]:
+            return Point
+
+    class TestModel(base):  # type: ignore[misc,valid-type]
+        __tablename__ = "test"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        p: Mapped[Optional[str]] = mapped_column(PointType())
+
+    app = web.Application()
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(base.metadata.create_all)
+        await conn.execute(sa.insert(TestModel), {"p": "1,2"})
+
+    schema: aiohttp_admin.Schema = {
+        "security": {
+            "check_credentials": check_credentials,
+            "secure": False
+        },
+        "resources": ({"model": SAResource(engine, TestModel)},)
+    }
+    app[admin] = aiohttp_admin.setup(app, schema)
+
+    admin_client = await aiohttp_client(app)
+    assert admin_client.app
+    h = await login(admin_client)
+
+    url = app[admin].router["test_get_list"].url_for()
+    p = {"pagination": json.dumps({"page": 1, "perPage": 10}),
+         "sort": json.dumps({"field": "id", "order": "ASC"}),
+         "filter": json.dumps({"id": 1})}
+    async with admin_client.get(url, params=p, headers=h) as resp:
+        assert resp.status == 200
+        assert await resp.json() == {"data": [{"id": "1", "data": {"id": 1, "p": "1,2"}}],
+                                     "total": 1}
@@ -94,6 +94,17 @@ async def test_list_filtering_by_pk(admin_client: TestClient, login: _Login) ->
         assert await resp.json() == {"data": [exp_rec], "total": 1}
 
 
+async def test_list_filtering_invalid_field(admin_client: TestClient, login: _Login) -> None:
+    h = await login(admin_client)
+    assert admin_client.app
+    url = admin_client.app[admin].router["dummy_get_list"].url_for()
+    p = {"pagination": '{"page": 1, "perPage": 10}',
+         "sort": '{"field": "id", "order": "ASC"}', "filter": '{"incorrect": 3}'}
+    async with admin_client.get(url, params=p, headers=h) as resp:
+        assert resp.status == 400
+        assert "Invalid field 'incorrect'" in await resp.text()
+
+
 @pytest.mark.xfail(reason="Need to implement #668 to make this work properly")
 async def test_list_text_like_filtering(admin_client: TestClient, login: _Login) -> None:
     h = await login(admin_client)